@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-15 06:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_content_to_body(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    PostBody = apps.get_model('blog', 'PostBody')
+    PostBody.objects.bulk_create(
+        PostBody(post_id=pk, content=content)
+        for pk, content in Post.objects.values_list('pk', 'content').iterator()
+    )
+
+
+def copy_body_to_content(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    PostBody = apps.get_model('blog', 'PostBody')
+    for post_id, content in PostBody.objects.values_list('post_id', 'content').iterator():
+        Post.objects.filter(pk=post_id).update(content=content)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_post_created_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostBody',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='body', serialize=False, to='blog.post')),
+                ('content', models.TextField()),
+            ],
+        ),
+        migrations.RunPython(copy_content_to_body, copy_body_to_content),
+        # Reversing RemoveField re-adds the column to existing rows, so it needs a default
+        migrations.AlterField(
+            model_name='post',
+            name='content',
+            field=models.TextField(default=''),
+        ),
+        migrations.RemoveField(
+            model_name='post',
+            name='content',
+        ),
+    ]
@@ -3,8 +3,24 @@ from django.db import models
 
 class Post(models.Model):
     title = models.CharField(max_length=200)
-    content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class PostBody(models.Model):
+    # Kept off the Post row so list scans never read the (large) content.
+    post = models.OneToOneField(
+        Post, primary_key=True, related_name='body', on_delete=models.CASCADE
+    )
+    content = models.TextField()
+
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return f"Body of post {self.post_id}"
\ No newline at end of file
@@ -1,3 +1,165 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from .models import Post, PostBody
+from .views import POST_LIST_VERSION_KEY
+
+
+class PostAPITestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def create_post(self, title='First', content='Hello'):
+        response = self.client.post(
+            reverse('post-create'), {'title': title, 'content': content}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def list_titles(self):
+        response = self.client.get(reverse('post-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row['title'] for row in response.data]
+
+
+class PostBulkCreateTests(PostAPITestCase):
+    def test_bulk_create_inserts_posts_and_bodies(self):
+        payload = [
+            {'title': 'One', 'content': 'first body'},
+            {'title': 'Two', 'content': 'second body'},
+        ]
+        response = self.client.post(reverse('post-bulk-create'), payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([row['title'] for row in response.data], ['One', 'Two'])
+        self.assertEqual(
+            dict(PostBody.objects.values_list('post__title', 'content')),
+            {'One': 'first body', 'Two': 'second body'},
+        )
+
+    def test_bulk_create_rejects_non_list_input(self):
+        response = self.client.post(
+            reverse('post-bulk-create'), {'title': 'One', 'content': 'x'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Post.objects.exists())
+
+    def test_bulk_create_rejects_invalid_item(self):
+        response = self.client.post(
+            reverse('post-bulk-create'), [{'title': 'One'}], format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Post.objects.exists())
+
+
+class PostListCacheTests(PostAPITestCase):
+    def test_repeat_list_is_served_from_cache(self):
+        self.create_post()
+        self.list_titles()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.list_titles(), ['First'])
+
+    def test_create_invalidates_list(self):
+        self.create_post('First')
+        self.assertEqual(self.list_titles(), ['First'])
+
+        self.create_post('Second')
+
+        self.assertEqual(self.list_titles(), ['Second', 'First'])
+
+    def test_bulk_create_invalidates_list(self):
+        self.assertEqual(self.list_titles(), [])
+
+        self.client.post(
+            reverse('post-bulk-create'), [{'title': 'Bulk', 'content': 'x'}], format='json'
+        )
+
+        self.assertEqual(self.list_titles(), ['Bulk'])
+
+    def test_update_invalidates_list(self):
+        post = self.create_post('Before')
+        self.assertEqual(self.list_titles(), ['Before'])
+
+        self.client.patch(
+            reverse('post-update', args=[post['id']]), {'title': 'After'}, format='json'
+        )
+
+        self.assertEqual(self.list_titles(), ['After'])
+
+    def test_evicted_version_does_not_revive_stale_list(self):
+        self.create_post('First')
+        self.assertEqual(self.list_titles(), ['First'])
+        cache.delete(POST_LIST_VERSION_KEY)
+        self.assertEqual(self.list_titles(), ['First'])
+        cache.delete(POST_LIST_VERSION_KEY)
+
+        self.create_post('Second')
+
+        self.assertEqual(self.list_titles(), ['Second', 'First'])
+
+    def test_delete_invalidates_list(self):
+        post = self.create_post()
+        self.assertEqual(self.list_titles(), ['First'])
+
+        self.client.delete(reverse('post-delete', args=[post['id']]))
+
+        self.assertEqual(self.list_titles(), [])
+
+
+class PostBodyTests(PostAPITestCase):
+    def test_create_writes_body(self):
+        post = self.create_post(content='Stored apart')
+
+        self.assertEqual(PostBody.objects.get(post_id=post['id']).content, 'Stored apart')
+
+    def test_update_writes_body(self):
+        post = self.create_post()
+
+        response = self.client.patch(
+            reverse('post-update', args=[post['id']]), {'content': 'Edited'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['content'], 'Edited')
+        self.assertEqual(PostBody.objects.get(post_id=post['id']).content, 'Edited')
+
+    def test_detail_reads_body_in_one_query(self):
+        post = self.create_post(content='Joined')
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('post-detail', args=[post['id']]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['content'], 'Joined')
+
+    def test_post_without_body(self):
+        post = Post.objects.create(title='No body')
+        detail_url = reverse('post-detail', args=[post.pk])
+
+        self.assertEqual(self.client.get(detail_url).data['content'], '')
+
+        response = self.client.patch(
+            reverse('post-update', args=[post.pk]), {'content': 'Added'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(detail_url).data['content'], 'Added')
+
+
+class PostDateTimeFormatTests(PostAPITestCase):
+    @override_settings(REST_FRAMEWORK={'DATETIME_FORMAT': '%Y-%m-%d'})
+    def test_created_at_follows_datetime_format(self):
+        post = self.create_post()
+        date = Post.objects.get(pk=post['id']).created_at.strftime('%Y-%m-%d')
+
+        detail = self.client.get(reverse('post-detail', args=[post['id']]))
+        listing = self.client.get(reverse('post-list'))
+
+        self.assertEqual(detail.data['created_at'], date)
+        self.assertEqual(listing.data[0]['created_at'], date)
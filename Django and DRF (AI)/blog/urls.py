@@ -5,6 +5,7 @@ urlpatterns = [
     path('posts/', views.PostList.as_view(), name='post-list'),
     path('posts/<int:pk>/', views.PostDetail.as_view(), name='post-detail'),
     path('posts/create/', views.PostCreate.as_view(), name='post-create'),
+    path('posts/bulk-create/', views.PostBulkCreate.as_view(), name='post-bulk-create'),
     path('posts/<int:pk>/update/', views.PostUpdate.as_view(), name='post-update'),
     path('posts/<int:pk>/delete/', views.PostDelete.as_view(), name='post-delete'),
 ]
\ No newline at end of file
@@ -1,22 +1,76 @@
 # views.py
+import time
+
+from django.core.cache import cache
 from rest_framework import generics
+from rest_framework.response import Response
 from .models import Post
-from .serializers import PostSerializer
+from .serializers import PostSerializer, PostListSerializer
+
+POST_LIST_CACHE_TIMEOUT = 60
+POST_LIST_VERSION_KEY = 'posts:list:version'
+
+def invalidate_post_list_cache():
+    # Bumping the version orphans every cached list page at once; stale
+    # entries simply expire. Works on any cache backend, unlike delete_pattern.
+    try:
+        cache.incr(POST_LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(POST_LIST_VERSION_KEY, time.time_ns(), None)
 
 class PostList(generics.ListAPIView):
-    queryset = Post.objects.all()
-    serializer_class = PostSerializer
+    serializer_class = PostListSerializer
+
+    def get_queryset(self):
+        # Summaries only, as plain dicts: no Post instances are built per row.
+        return Post.objects.values('id', 'title', 'created_at')
+
+    def list(self, request, *args, **kwargs):
+        # The version key can be evicted despite timeout=None; reseeding from
+        # the clock instead of 1 means an old list entry is never reused.
+        version = cache.get_or_set(POST_LIST_VERSION_KEY, time.time_ns, None)
+        # The list takes no query parameters, so they are left out of the key.
+        key = f"posts:list:{version}"
+        data = cache.get_or_set(
+            key,
+            lambda: super(PostList, self).list(request, *args, **kwargs).data,
+            POST_LIST_CACHE_TIMEOUT,
+        )
+        return Response(data)
 
 class PostDetail(generics.RetrieveAPIView):
-    queryset = Post.objects.all()
+    queryset = Post.objects.select_related('body')
     serializer_class = PostSerializer
 
 class PostCreate(generics.CreateAPIView):
     serializer_class = PostSerializer
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        invalidate_post_list_cache()
+
+class PostBulkCreate(generics.CreateAPIView):
+    serializer_class = PostSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        invalidate_post_list_cache()
+
 class PostUpdate(generics.UpdateAPIView):
-    queryset = Post.objects.all()
+    queryset = Post.objects.select_related('body')
     serializer_class = PostSerializer
 
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        invalidate_post_list_cache()
+
 class PostDelete(generics.DestroyAPIView):
-    queryset = Post.objects.all()
\ No newline at end of file
+    queryset = Post.objects.all()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_post_list_cache()
@@ -1,19 +1,50 @@
 import logging
 import logging.handlers
+import atexit
+import copy
 import json
+import os
+import queue
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import traceback
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """Serialize a log entry to a JSON string, using orjson when available"""
+    # Both paths accept non-str keys and produce the same compact output
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted prefix) - records arrive in bursts within the same second
+        self._timestamp_cache = (None, '')
+    
+    def _timestamp(self, record) -> str:
+        seconds = int(record.created)
+        cached_seconds, prefix = self._timestamp_cache
+        if cached_seconds != seconds:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', self.converter(seconds))
+            self._timestamp_cache = (seconds, prefix)
+        return f"{prefix}.{int(record.msecs):03d}"
+    
     def format(self, record):
+        attrs = record.__dict__
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._timestamp(record),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -27,19 +58,116 @@ class JSONFormatter(logging.Formatter):
             log_entry['exception'] = self.formatException(record.exc_info)
         
         # Add extra fields if present
-        if hasattr(record, 'user_id'):
-            log_entry['user_id'] = record.user_id
-        if hasattr(record, 'request_id'):
-            log_entry['request_id'] = record.request_id
-        if hasattr(record, 'extra_data'):
-            log_entry['extra_data'] = record.extra_data
+        user_id = attrs.get('user_id')
+        if user_id is not None:
+            log_entry['user_id'] = user_id
+        request_id = attrs.get('request_id')
+        if request_id is not None:
+            log_entry['request_id'] = request_id
+        extra_data = attrs.get('extra_data')
+        if extra_data is not None:
+            log_entry['extra_data'] = extra_data
             
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _dumps(log_entry)
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue that keeps exc_info for the listener's formatters"""
+    
+    def prepare(self, record):
+        # The stock prepare() formats the record and drops exc_info, which would
+        # hide exceptions from JSONFormatter; an in-process queue needs neither.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that batches writes, flushing every few records or seconds"""
+    
+    def __init__(self, filename, buffer_size: int = 64 * 1024,
+                 flush_every: int = 100, flush_interval: float = 1.0, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._size = 0
+        super().__init__(filename, **kwargs)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.fstat(stream.fileno()).st_size
+        self._pending = 0
+        return stream
+    
+    def emit(self, record):
+        # Mirrors RotatingFileHandler.emit, but tracks the file size itself:
+        # stream.tell() would flush the buffer on every record.
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Count encoded bytes, not characters, so non-ASCII output rotates on time
+            size = len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:  # doRollover() leaves it closed when delay=True
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            self._pending += 1
+            if (self._pending >= self.flush_every
+                    or record.levelno >= logging.ERROR
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers once the queue has been idle for a while"""
+    
+    def __init__(self, log_queue, *handlers, flush_interval: float = 1.0,
+                 respect_handler_level: bool = False):
+        super().__init__(log_queue, *handlers,
+                         respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._unflushed = False
+    
+    def dequeue(self, block):
+        # Buffered handlers only flush when a record arrives; on a quiet process
+        # this timeout is what bounds how long a record can sit in a buffer.
+        if not block:
+            return super().dequeue(block)
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._unflushed:
+                    for handler in self.handlers:
+                        handler.flush()
+                    self._unflushed = False
+                continue
+            self._unflushed = True
+            return record
 
 
 class LoggingSystem:
     """Centralized logging system with multiple handlers and formatters"""
     
+    # The instance whose queue listener currently owns the root logger
+    _active: Optional["LoggingSystem"] = None
+    
     def __init__(self, app_name: str = "MyApp", log_dir: str = "logs"):
         self.app_name = app_name
         self.log_dir = Path(log_dir)
@@ -49,13 +177,23 @@ class LoggingSystem:
         self.root_logger = logging.getLogger()
         self.root_logger.setLevel(logging.DEBUG)
         
-        # Clear existing handlers
+        # Stop a previous system's listener thread and clear existing handlers
+        if LoggingSystem._active is not None:
+            LoggingSystem._active.shutdown(reattach=False)
         self.root_logger.handlers.clear()
         
+        self._loggers: Dict[str, logging.Logger] = {}
+        # logger name -> {level name: bound logging method}, built on first use
+        self._level_methods: Dict[str, Dict[str, Callable[..., None]]] = {}
+        
+        self._queue_handler: Optional[logging.Handler] = None
+        self._listener: Optional[FlushingQueueListener] = None
         self._setup_handlers()
+        LoggingSystem._active = self
         
     def _setup_handlers(self):
-        """Setup various logging handlers"""
+        """Setup various logging handlers behind a background queue listener"""
+        real_handlers = []
         
         # Console handler with colored output
         console_handler = logging.StreamHandler(sys.stdout)
@@ -65,10 +203,10 @@ class LoggingSystem:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        self.root_logger.addHandler(console_handler)
+        real_handlers.append(console_handler)
         
         # File handler for general logs
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             self.log_dir / f"{self.app_name}.log",
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
@@ -78,17 +216,17 @@ class LoggingSystem:
             '%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        self.root_logger.addHandler(file_handler)
+        real_handlers.append(file_handler)
         
         # JSON file handler for structured logs
-        json_handler = logging.handlers.RotatingFileHandler(
+        json_handler = BufferedRotatingFileHandler(
             self.log_dir / f"{self.app_name}_structured.json",
             maxBytes=10*1024*1024,
             backupCount=5
         )
         json_handler.setLevel(logging.INFO)
         json_handler.setFormatter(JSONFormatter())
-        self.root_logger.addHandler(json_handler)
+        real_handlers.append(json_handler)
         
         # Error file handler
         error_handler = logging.handlers.RotatingFileHandler(
@@ -98,18 +236,74 @@ class LoggingSystem:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        self.root_logger.addHandler(error_handler)
+        real_handlers.append(error_handler)
+        
+        # Callers only enqueue records; the listener thread does all the I/O
+        log_queue = queue.Queue(-1)
+        self._queue_handler = LocalQueueHandler(log_queue)
+        self.root_logger.addHandler(self._queue_handler)
+        self._listener = FlushingQueueListener(
+            log_queue, *real_handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
+    
+    def shutdown(self, reattach: bool = True):
+        """Stop the queue listener, flushing any records still queued.
+        
+        With reattach (the default) the real handlers go back on the root logger so
+        records logged afterwards, e.g. from later atexit hooks, are still written
+        synchronously; otherwise they are closed.
+        """
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self.root_logger.removeHandler(self._queue_handler)
+        for handler in self._listener.handlers:
+            # stop() drains the queue, but buffered handlers may still hold records
+            handler.flush()
+            if reattach:
+                if isinstance(handler, BufferedRotatingFileHandler):
+                    # No listener is left to flush them when idle; write through
+                    handler.flush_every = 1
+                self.root_logger.addHandler(handler)
+            else:
+                handler.close()
+        self._listener = None
+        self._queue_handler = None
+        if LoggingSystem._active is self:
+            LoggingSystem._active = None
     
     def get_logger(self, name: str) -> logging.Logger:
         """Get a logger with the specified name"""
-        return logging.getLogger(name)
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = logging.getLogger(name)
+        return logger
+    
+    def _get_level_methods(self, logger_name: str) -> Dict[str, Callable[..., None]]:
+        """Return the bound level methods of a logger, keyed by lower- and upper-case level name"""
+        methods = self._level_methods.get(logger_name)
+        if methods is None:
+            logger = self.get_logger(logger_name)
+            methods = {}
+            for level in ('debug', 'info', 'warning', 'error', 'critical'):
+                methods[level] = methods[level.upper()] = getattr(logger, level)
+            self._level_methods[logger_name] = methods
+        return methods
     
     def log_with_context(self, logger_name: str, level: str, message: str, 
                         user_id: Optional[str] = None, 
                         request_id: Optional[str] = None,
                         extra_data: Optional[Dict[str, Any]] = None):
         """Log with additional context information"""
-        logger = self.get_logger(logger_name)
+        methods = self._get_level_methods(logger_name)
+        log = methods.get(level)
+        if log is None:
+            # Any other Logger method name (exception, warn, fatal, mixed case):
+            # resolve it like getattr(logger, level.lower()) once and remember it
+            log = getattr(self.get_logger(logger_name), level.lower())
+            methods[level] = log
         
         # Create log record with extra context
         extra = {}
@@ -120,7 +314,7 @@ class LoggingSystem:
         if extra_data:
             extra['extra_data'] = extra_data
         
-        getattr(logger, level.lower())(message, extra=extra)
+        log(message, extra=extra)
 
 
 class DatabaseLogger:
@@ -132,6 +326,9 @@ class DatabaseLogger:
     def log_query(self, query: str, params: Optional[Dict] = None, 
                   execution_time: Optional[float] = None):
         """Log database query with execution details"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         message = f"Executing query: {query[:100]}..."
         if execution_time:
             message += f" (took {execution_time:.3f}s)"
@@ -146,6 +343,9 @@ class DatabaseLogger:
     
     def log_error(self, error: Exception, query: Optional[str] = None):
         """Log database error"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         message = f"Database error: {str(error)}"
         extra_data = {"error_type": type(error).__name__}
         if query:
@@ -159,10 +359,15 @@ class APILogger:
     
     def __init__(self, logging_system: LoggingSystem):
         self.logger = logging_system.get_logger("api")
+        self._info = self.logger.info
+        self._warning = self.logger.warning
     
     def log_request(self, method: str, endpoint: str, user_id: Optional[str] = None,
                    request_id: Optional[str] = None, ip_address: Optional[str] = None):
         """Log incoming API request"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         message = f"{method} {endpoint}"
         extra_data = {
             "method": method,
@@ -176,11 +381,15 @@ class APILogger:
         if request_id:
             extra["request_id"] = request_id
             
-        self.logger.info(message, extra=extra)
+        self._info(message, extra=extra)
     
     def log_response(self, status_code: int, response_time: float,
                     request_id: Optional[str] = None):
         """Log API response"""
+        level = logging.WARNING if status_code >= 400 else logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+        
         message = f"Response: {status_code} (took {response_time:.3f}s)"
         extra_data = {
             "status_code": status_code,
@@ -191,8 +400,8 @@ class APILogger:
         if request_id:
             extra["request_id"] = request_id
             
-        level = "warning" if status_code >= 400 else "info"
-        getattr(self.logger, level)(message, extra=extra)
+        log = self._warning if status_code >= 400 else self._info
+        log(message, extra=extra)
 
 
 class SecurityLogger:
@@ -200,10 +409,16 @@ class SecurityLogger:
     
     def __init__(self, logging_system: LoggingSystem):
         self.logger = logging_system.get_logger("security")
+        self._info = self.logger.info
+        self._warning = self.logger.warning
     
     def log_login_attempt(self, username: str, success: bool, ip_address: str,
                          user_agent: Optional[str] = None):
         """Log login attempts"""
+        level = logging.INFO if success else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
+        
         status = "successful" if success else "failed"
         message = f"Login attempt {status} for user: {username} from {ip_address}"
         
@@ -215,11 +430,14 @@ class SecurityLogger:
             "event_type": "login_attempt"
         }
         
-        level = "info" if success else "warning"
-        getattr(self.logger, level)(message, extra={"extra_data": extra_data})
+        log = self._info if success else self._warning
+        log(message, extra={"extra_data": extra_data})
     
     def log_permission_denied(self, user_id: str, resource: str, action: str):
         """Log permission denied events"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        
         message = f"Permission denied: User {user_id} attempted {action} on {resource}"
         extra_data = {
             "user_id": user_id,
@@ -228,7 +446,7 @@ class SecurityLogger:
             "event_type": "permission_denied"
         }
         
-        self.logger.warning(message, extra={"extra_data": extra_data})
+        self._warning(message, extra={"extra_data": extra_data})
 
 
 # Usage Examples
@@ -288,6 +506,7 @@ def demo_logging_system():
         app_logger.error("An error occurred during processing", exc_info=True)
         db_logger.log_error(e, "SELECT * FROM invalid_table")
     
+    logging_system.shutdown()
     print("Logging demo completed!")
 
 
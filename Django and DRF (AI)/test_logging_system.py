@@ -0,0 +1,128 @@
+import importlib.util
+import io
+import logging
+import os
+import queue
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# The logging system lives in test.py; load it by path so the stdlib ``test``
+# package cannot shadow it.
+_spec = importlib.util.spec_from_file_location(
+    "logging_system", Path(__file__).resolve().with_name("test.py")
+)
+logging_system = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(logging_system)
+
+
+def make_record(message, level=logging.INFO):
+    return logging.makeLogRecord({
+        "name": "tests",
+        "msg": message,
+        "levelno": level,
+        "levelname": logging.getLevelName(level),
+    })
+
+
+class BufferedRotatingFileHandlerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "app.log")
+
+    def make_handler(self, **kwargs):
+        handler = logging_system.BufferedRotatingFileHandler(self.path, **kwargs)
+        self.addCleanup(handler.close)
+        return handler
+
+    def read(self, path=None):
+        with open(path or self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_rotated_files_stay_under_max_bytes_with_non_ascii(self):
+        handler = self.make_handler(maxBytes=10000, backupCount=3, encoding="utf-8")
+        for _ in range(600):
+            handler.handle(make_record("é" * 40))
+        handler.close()
+
+        for suffix in ("", ".1", ".2", ".3"):
+            size = os.path.getsize(self.path + suffix)
+            self.assertLessEqual(size, 10000, f"app.log{suffix} is {size} bytes")
+
+    def test_rollover_with_delay_does_not_fail(self):
+        handler = self.make_handler(maxBytes=500, backupCount=2, delay=True)
+        with mock.patch.object(handler, "handleError") as handle_error:
+            for i in range(50):
+                handler.handle(make_record(f"record {i:02d} " + "x" * 20))
+        handler.close()
+
+        handle_error.assert_not_called()
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertIn("record 49", self.read())
+
+    def test_info_records_are_buffered(self):
+        handler = self.make_handler(flush_every=100, flush_interval=60)
+        handler.handle(make_record("buffered"))
+
+        self.assertEqual(self.read(), "")
+
+    def test_error_record_is_flushed_immediately(self):
+        handler = self.make_handler(flush_every=100, flush_interval=60)
+        handler.handle(make_record("earlier"))
+        handler.handle(make_record("failure", logging.ERROR))
+
+        self.assertEqual(self.read(), "earlier\nfailure\n")
+
+    def test_idle_listener_flushes_within_flush_interval(self):
+        handler = self.make_handler(flush_every=100, flush_interval=60)
+        log_queue = queue.Queue()
+        listener = logging_system.FlushingQueueListener(
+            log_queue, handler, flush_interval=0.05
+        )
+        listener.start()
+        self.addCleanup(listener.stop)
+
+        log_queue.put(make_record("eventually"))
+        deadline = time.monotonic() + 2
+        while "eventually" not in self.read() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.read(), "eventually\n")
+
+
+class LoggingSystemShutdownTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = logging.getLogger()
+        self.addCleanup(setattr, root, "handlers", list(root.handlers))
+        self.addCleanup(root.setLevel, root.level)
+        with mock.patch("sys.stdout", io.StringIO()):
+            self.system = logging_system.LoggingSystem("app", tmp.name)
+        self.addCleanup(self.close_root_handlers)
+        self.addCleanup(self.system.shutdown, reattach=False)
+        self.log_path = Path(tmp.name, "app.log")
+
+    def close_root_handlers(self):
+        # shutdown() reattaches the real handlers to the root logger
+        for handler in logging.getLogger().handlers:
+            handler.close()
+
+    def test_shutdown_flushes_buffered_records(self):
+        self.system.get_logger("tests").info("before shutdown")
+        self.system.shutdown()
+
+        self.assertIn("before shutdown", self.log_path.read_text())
+
+    def test_records_after_shutdown_are_written(self):
+        self.system.shutdown()
+        logging.getLogger("tests").debug("after shutdown")
+
+        self.assertIn("after shutdown", self.log_path.read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()